@@ -48,8 +48,14 @@ options:
         description: Absolute path to the Oracle Wallet directory.
         required: false
         type: str
+    wallet_password:
+        description: Password of an encrypted PEM wallet (C(ewallet.pem)) in I(wallet_location).
+        required: false
+        type: str
     client_lib_dir:
-        description: Absolute path to the Oracle Instant Client library (containing `libclntsh.so`).
+        description:
+          - Absolute path to the Oracle Instant Client library (containing `libclntsh.so`).
+          - When set, python-oracledb runs in Thick mode; otherwise the pure Python Thin mode is used.
         required: false
         type: str
     db_action:
@@ -58,13 +64,98 @@ options:
         type: str
         choices: ['export']
     table_name:
-        description: The name of the table to export.
+        description:
+          - The name of the table to export, optionally prefixed with its schema (C(SCHEMA.TABLE)).
+          - Must be a plain Oracle identifier; it is upper-cased and quoted in the generated query.
         required: false
         type: str
     save_path:
         description: Path where the exported CSV file will be saved.
         required: false
         type: str
+    arraysize:
+        description: Number of rows fetched from the database per round trip during export.
+        required: false
+        type: int
+        default: 10000
+    prefetchrows:
+        description:
+          - Number of rows prefetched by the driver when the export query is executed.
+          - Defaults to I(arraysize) + 1 so the first fetch is served without an extra round trip.
+        required: false
+        type: int
+    csv_engine:
+        description:
+          - How rows are formatted into CSV during export.
+          - C(python) writes values as-is with no quoting or escaping.
+          - C(arrow) uses pyarrow's C++ CSV writer, which is much faster on large tables but always double-quotes
+            every value of a string column and formats dates the Arrow way.
+          - With python-oracledb 3.0+ the C(arrow) engine fetches rows as Arrow data frames, where C(NUMBER) columns
+            declared without precision are read as 64-bit floats; integers above 2**53 (for example large IDs)
+            lose precision without an error. Use C(python) for such tables.
+          - On the row-by-row path the C(arrow) engine keeps C(NUMBER) integers wider than 64 bits exact by writing
+            them as decimals; a batch of a column whose values Arrow cannot type (for example integers with more
+            than 38 digits) is written as quoted strings instead.
+          - Both engines write binary (RAW, BLOB) values as hexadecimal.
+        required: false
+        type: str
+        choices: ['python', 'arrow']
+        default: python
+    count_hint:
+        description:
+          - Count the rows to export first and stop fetching after the last one, saving the final round trip
+            that only reports the end of the data.
+          - The count and the export run in one read-only transaction so they see the same rows.
+          - The count is an extra query over the table, so this only pays off for small and medium tables;
+            it is ignored for tables with more than 10 million rows and when rows are fetched as Arrow data frames.
+        required: false
+        type: bool
+        default: false
+    compression:
+        description:
+          - Compress the exported CSV while it is written.
+          - C(gzip) uses compression level 1; C(zstd) uses level 3 with one compression thread per CPU.
+          - The file is written to I(save_path) as given, so include the matching extension (for example C(.csv.gz)).
+          - With I(parallelism) the part index goes before the extensions, for example C(x.part0.csv.gz).
+        required: false
+        type: str
+        choices: ['none', 'gzip', 'zstd']
+        default: none
+    io_backend:
+        description:
+          - How the exported file is written to disk.
+          - C(sync) writes from the export loop itself.
+          - C(thread) hands filled write buffers to a background thread, so the next batch is fetched and
+            formatted while the previous one is still being written.
+        required: false
+        type: str
+        choices: ['sync', 'thread']
+        default: sync
+    sdu:
+        description:
+          - Session Data Unit size in bytes requested for the connection (512 to 2097152).
+          - Larger values let each fetch round trip carry more row data; the server may negotiate it down.
+        required: false
+        type: int
+        default: 2097152
+    parallelism:
+        description:
+          - Number of worker processes used to export the table.
+          - When greater than 1 the table is split with C(ORA_HASH(ROWID)) and each worker writes its own
+            file over its own connection; only the C(part0) file has a header line.
+          - Workers are forked, which the Oracle Client libraries do not support, so values above 1 cannot be
+            combined with I(client_lib_dir).
+          - The task fails if any shard fails to export.
+          - Part files are named after I(save_path) with C(.part<k>) inserted before its extensions, so
+            C(/tmp/x.csv) becomes C(/tmp/x.part0.csv), C(/tmp/x.part1.csv) and so on.
+        required: false
+        type: int
+        default: 1
+
+requirements:
+    - python-oracledb
+    - pyarrow >= 14 (when I(csv_engine=arrow))
+    - zstandard (when I(compression=zstd))
 
 author:
     - philipduncan860@gmail.com
@@ -93,56 +184,538 @@ message:
     returned: always
 '''
 
-from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
 import oracledb
+import concurrent.futures
+import contextlib
 import csv
+import gzip
+import inspect
+import io
+import multiprocessing
 import os
+import queue
+import re
+import threading
+import traceback
+
+PYARROW_IMPORT_ERROR = None
+try:
+    import pyarrow
+    import pyarrow.compute
+    import pyarrow.csv
+except ImportError:
+    HAS_PYARROW = False
+    PYARROW_IMPORT_ERROR = traceback.format_exc()
+else:
+    HAS_PYARROW = True
+
+ZSTANDARD_IMPORT_ERROR = None
+try:
+    import zstandard
+except ImportError:
+    HAS_ZSTANDARD = False
+    ZSTANDARD_IMPORT_ERROR = traceback.format_exc()
+else:
+    HAS_ZSTANDARD = True
+
+# Set once init_thick_mode has loaded the Oracle Client libraries in this process
+_THICK_INITIALIZED = False
+
+# Optionally schema-qualified unquoted Oracle identifier
+TABLE_NAME_PATTERN = re.compile(r'[A-Za-z_][A-Za-z0-9_$#]*(\.[A-Za-z_][A-Za-z0-9_$#]*)?')
+
+# Older python-oracledb releases (such as 1.2.2) have no sdu connect keyword and reject it with TypeError
+CONNECT_SUPPORTS_SDU = 'sdu' in inspect.signature(oracledb.connect).parameters
+
+# Statements kept in each session's statement cache so repeated exports skip the parse round trip
+STATEMENT_CACHE_SIZE = 40
+
+# Above this many rows the saved end-of-fetch round trip is negligible, so the count is not used
+COUNT_HINT_MAX_ROWS = 10000000
+
+# Column types whose values are str and may carry trailing CHAR padding
+STRING_TYPES = (
+    oracledb.DB_TYPE_CHAR,
+    oracledb.DB_TYPE_NCHAR,
+    oracledb.DB_TYPE_VARCHAR,
+    oracledb.DB_TYPE_NVARCHAR,
+    oracledb.DB_TYPE_LONG,
+    oracledb.DB_TYPE_LONG_NVARCHAR,
+    oracledb.DB_TYPE_CLOB,
+    oracledb.DB_TYPE_NCLOB,
+)
+
+# Column types whose values never need cleaning and are written with str()
+NUMERIC_AND_DATETIME_TYPES = (
+    oracledb.DB_TYPE_NUMBER,
+    oracledb.DB_TYPE_BINARY_INTEGER,
+    oracledb.DB_TYPE_BINARY_FLOAT,
+    oracledb.DB_TYPE_BINARY_DOUBLE,
+    oracledb.DB_TYPE_DATE,
+    oracledb.DB_TYPE_TIMESTAMP,
+    oracledb.DB_TYPE_TIMESTAMP_TZ,
+    oracledb.DB_TYPE_TIMESTAMP_LTZ,
+)
+
+# Column types whose values are bytes and are written as hexadecimal
+BINARY_TYPES = (
+    oracledb.DB_TYPE_RAW,
+    oracledb.DB_TYPE_LONG_RAW,
+    oracledb.DB_TYPE_BLOB,
+)
+
+# Large userspace buffer so each exported batch turns into a few big write() calls
+WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+
+def quote_table_name(table_name):
+    """Returns table_name as an upper-cased, double-quoted (optionally schema-qualified) identifier."""
+    return '.'.join('"' + part.upper() + '"' for part in table_name.split('.'))
+
+
+class BackgroundFileWriter(io.RawIOBase):
+    """Unbuffered binary file whose writes are performed by a background thread.
+
+    write() only queues a copy of the data, so the caller can carry on
+    fetching and formatting while the kernel copies the previous chunk.
+    At most max_pending chunks are queued before write() blocks.
+    """
+
+    def __init__(self, path, max_pending=2):
+        super().__init__()
+        self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._error = None
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if self._error is not None:
+            raise self._error
+        # The caller may reuse its buffer as soon as we return
+        chunk = bytes(data)
+        self._queue.put(chunk)
+        return len(chunk)
+
+    def _drain(self):
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                break
+            if self._error is not None:
+                continue
+            try:
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(self._fd, view):]
+            except OSError as e:
+                self._error = e
+
+    def close(self):
+        if self.closed:
+            return
+        super().close()
+        self._queue.put(None)
+        self._thread.join()
+        os.close(self._fd)
+        if self._error is not None:
+            raise self._error
+
+
+@contextlib.contextmanager
+def open_export_file(save_path, compression='none', io_backend='sync'):
+    """Opens save_path for binary writing, compressing the stream on the fly when requested."""
+    if io_backend == 'thread':
+        raw_file = io.BufferedWriter(BackgroundFileWriter(save_path), buffer_size=WRITE_BUFFER_SIZE)
+    else:
+        raw_file = open(save_path, 'wb', buffering=WRITE_BUFFER_SIZE)
+
+    with raw_file:
+        if compression == 'gzip':
+            # Level 1 keeps gzip from becoming the new bottleneck of the export
+            with gzip.GzipFile(fileobj=raw_file, mode='wb', compresslevel=1) as csv_file:
+                yield csv_file
+        elif compression == 'zstd':
+            with zstandard.ZstdCompressor(level=3, threads=-1).stream_writer(raw_file) as csv_file:
+                yield csv_file
+        else:
+            yield raw_file
+
+
+def fetch_lobs_inline(cursor, metadata):
+    """Output type handler that fetches LOB columns as str/bytes with the row data.
+
+    Without it every LOB value becomes a locator that needs its own round
+    trip to read when the row is written out.
+    """
+    if metadata.type_code is oracledb.DB_TYPE_CLOB:
+        return cursor.var(oracledb.DB_TYPE_LONG, arraysize=cursor.arraysize)
+    if metadata.type_code is oracledb.DB_TYPE_NCLOB:
+        return cursor.var(oracledb.DB_TYPE_LONG_NVARCHAR, arraysize=cursor.arraysize)
+    if metadata.type_code is oracledb.DB_TYPE_BLOB:
+        return cursor.var(oracledb.DB_TYPE_LONG_RAW, arraysize=cursor.arraysize)
+
+
+def format_value(val):
+    """Formats a single value of any type as a clean CSV cell."""
+    if val is None:
+        return ''
+    if isinstance(val, str):
+        return val.rstrip()  # Remove trailing CHAR padding
+    if isinstance(val, bytes):
+        return val.hex()
+    return str(val)
+
+
+def column_formatter(type_code):
+    """Returns a function that formats a whole column of fetched values as CSV cells.
+
+    The conversion is picked once from the column type so cells of known
+    types skip the per-value type dispatch of format_value.
+    """
+    if type_code in STRING_TYPES:
+        convert = str.rstrip  # Remove trailing CHAR padding
+    elif type_code in NUMERIC_AND_DATETIME_TYPES:
+        convert = str
+    elif type_code in BINARY_TYPES:
+        convert = bytes.hex
+    else:
+        return lambda values: map(format_value, values)
+
+    # Always check for None: Oracle may describe a column as NOT NULL and still return NULLs
+    # (for example view columns from the outer-joined side of a join)
+    return lambda values: ['' if val is None else convert(val) for val in values]
+
+
+def fetch_batches(cursor, row_count=None):
+    """Yields the remaining rows of cursor in batches of at most cursor.arraysize rows.
+
+    When row_count is known the last batch is sized to the rows that are
+    left and fetching stops there, instead of asking the database once
+    more only to learn that no rows remain.
+    """
+    remaining = row_count
+    while remaining is None or remaining > 0:
+        size = cursor.arraysize if remaining is None else min(cursor.arraysize, remaining)
+        rows = cursor.fetchmany(size)
+        if not rows:
+            break
+        if remaining is not None:
+            remaining -= len(rows)
+        yield rows
+
+
+def fetch_batches_in_background(cursor, row_count=None, max_pending=2):
+    """Yields the same batches as fetch_batches, fetching them in a background thread.
+
+    The next batch is fetched from the database while the caller formats
+    and writes the current one. At most max_pending fetched batches wait
+    in memory, so a slow writer holds back the fetcher instead of letting
+    batches pile up.
+    """
+    batches = queue.Queue(maxsize=max_pending)
+    stopped = threading.Event()
+
+    def fetch():
+        try:
+            for rows in fetch_batches(cursor, row_count):
+                batches.put(rows)
+                if stopped.is_set():
+                    return
+        except BaseException as e:
+            # Hand any error, including a BaseException, to the consumer instead of dying silently
+            batches.put(e)
+        finally:
+            # Always wake the consumer, whatever ended the thread
+            batches.put(None)
+
+    fetcher = threading.Thread(target=fetch, daemon=True)
+    fetcher.start()
+    try:
+        while True:
+            rows = batches.get()
+            if rows is None:
+                break
+            if isinstance(rows, BaseException):
+                raise rows
+            yield rows
+    finally:
+        stopped.set()
+        # Make room for a fetcher blocked on a full queue so it can see the stop flag
+        while fetcher.is_alive():
+            try:
+                batches.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        fetcher.join()
+
+
+def write_rows_python(cursor, csv_file, row_count=None):
+    """Writes the remaining rows of cursor as clean CSV lines using plain Python formatting.
+
+    Each batch is formatted column by column, encoded to UTF-8 in one go
+    and written to the binary csv_file, skipping the per-write codec work
+    of a text-mode file.
+    """
+    formatters = [column_formatter(desc[1]) for desc in cursor.description]
+
+    # Stream one batch at a time instead of holding the whole table in memory
+    for rows in fetch_batches_in_background(cursor, row_count):
+        cells = [formatter(values) for formatter, values in zip(formatters, zip(*rows))]
+        lines = map(','.join, zip(*cells))
+        csv_file.write(('\n'.join(lines) + '\n').encode('utf-8'))
+
+
+def write_arrow_table(table, csv_file):
+    """Writes an Arrow table as CSV rows, stripping trailing CHAR padding from string columns.
+
+    Binary columns are written as hexadecimal, since Arrow would otherwise
+    copy the raw bytes into the file and reject anything that is not UTF-8.
+    """
+    write_options = pyarrow.csv.WriteOptions(include_header=False)
+
+    arrays = []
+    for array in table.columns:
+        if pyarrow.types.is_string(array.type) or pyarrow.types.is_large_string(array.type):
+            array = pyarrow.compute.utf8_rtrim_whitespace(array)  # Remove trailing CHAR padding
+        elif (pyarrow.types.is_binary(array.type) or pyarrow.types.is_large_binary(array.type)
+              or pyarrow.types.is_fixed_size_binary(array.type)):
+            array = pyarrow.array([None if val is None else val.hex() for val in array.to_pylist()],
+                                  type=pyarrow.string())
+        arrays.append(array)
+
+    table = pyarrow.Table.from_arrays(arrays, names=table.column_names)
+    pyarrow.csv.write_csv(table, csv_file, write_options=write_options)
+
+
+def arrow_column(values, type_code, precision, scale):
+    """Builds the Arrow array for one fetched column, typed from its description where inference would fail.
+
+    Integer NUMBER columns too wide for int64 (NUMBER(19) to NUMBER(38))
+    become decimal128 so every digit is kept. Columns Arrow cannot infer,
+    such as integers above int64 in a NUMBER without precision, fall back
+    to decimal128(38, 0) and, if that does not fit either, to strings.
+    """
+    if type_code == oracledb.DB_TYPE_NUMBER and scale == 0 and precision > 18:
+        return pyarrow.array(values, type=pyarrow.decimal128(precision, 0))
 
-def export_table_to_csv(cursor, table_name, save_path):
-    """Exports a table to a clean CSV file: no quotes, no escaping, no padding."""
     try:
-        query = f"SELECT * FROM {table_name}"
-        cursor.execute(query)
-
-        columns = [desc[0] for desc in cursor.description]
-
-        with open(save_path, 'w', encoding='utf-8', newline='') as csv_file:
-            # Write header line
-            csv_file.write(','.join(columns) + '\n')
-
-            for row in cursor.fetchall():
-                cleaned_row = []
-                for val in row:
-                    if val is None:
-                        cleaned_row.append('')
-                    elif isinstance(val, str):
-                        cleaned_row.append(val.rstrip())  # Remove trailing CHAR padding
-                    else:
-                        cleaned_row.append(str(val))
-                csv_file.write(','.join(cleaned_row) + '\n')
-
-        return f"Table {table_name} exported successfully to {save_path}"
-    except Exception as e:
-        return f"Failed to export table {table_name}: {str(e)}"
+        return pyarrow.array(values)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, OverflowError):
+        pass
+
+    try:
+        return pyarrow.array(values, type=pyarrow.decimal128(38, 0))
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, OverflowError):
+        return pyarrow.array([None if val is None else str(val) for val in values], type=pyarrow.string())
+
+
+def write_rows_arrow(cursor, columns, csv_file, row_count=None):
+    """Writes the remaining rows of cursor as CSV, letting Arrow's C++ writer format every cell."""
+    description = cursor.description
+
+    for rows in fetch_batches_in_background(cursor, row_count):
+        arrays = [
+            arrow_column(values, desc[1], desc[4], desc[5])
+            for desc, values in zip(description, zip(*rows))
+        ]
+        write_arrow_table(pyarrow.Table.from_arrays(arrays, names=columns), csv_file)
+
+
+def write_data_frames_arrow(connection, query, parameters, arraysize, csv_file):
+    """Writes the rows of query as CSV from Arrow data frames fetched by python-oracledb.
+
+    The driver decodes rows straight into Arrow columns, so no Python
+    tuple or value object is ever built for the exported data. NUMBER
+    columns declared without precision are decoded as float64, unlike the
+    exact Python ints of the fetchmany path.
+    """
+    for data_frame in connection.fetch_df_batches(statement=query, parameters=parameters, size=arraysize):
+        write_arrow_table(pyarrow.table(data_frame), csv_file)
+
+
+def export_table(cursor, table_name, save_path, arraysize=10000, prefetchrows=None, csv_engine='python',
+                 compression='none', io_backend='sync', count_hint=False, shard=None, shard_count=1):
+    """Exports a table to a clean CSV file: no quotes, no escaping, no padding; raises on failure.
+
+    With csv_engine='arrow' cell formatting is done by pyarrow; every value
+    of a string column is double-quoted and dates use Arrow's format.
+    On python-oracledb 3.0+ the arrow engine also fetches the rows as Arrow
+    data frames instead of Python tuples; NUMBER columns without precision
+    then arrive as float64, so integers above 2**53 are not exact.
+    When shard is given only the rows with ORA_HASH(ROWID) equal to shard
+    are exported, and the header is written for shard 0 only.
+    With count_hint the rows are counted first so fetching can stop right
+    after the last one.
+    """
+    source = quote_table_name(table_name)
+    parameters = {}
+    if shard is not None:
+        source += " WHERE ORA_HASH(ROWID, :max_bucket) = :shard"
+        parameters = dict(max_bucket=shard_count - 1, shard=shard)
+    query = f"SELECT * FROM {source}"
+
+    use_data_frames = csv_engine == 'arrow' and hasattr(cursor.connection, 'fetch_df_batches')
+
+    row_count = None
+    if count_hint and not use_data_frames:
+        # Count and export in one read-only transaction so both see the same snapshot
+        cursor.execute("SET TRANSACTION READ ONLY")
+        cursor.execute(f"SELECT /*+ RESULT_CACHE */ COUNT(*) FROM {source}", parameters)
+        row_count, = cursor.fetchone()
+        if row_count > COUNT_HINT_MAX_ROWS:
+            row_count = None
+
+    if use_data_frames:
+        # Describe the columns for the header; the parsed statement is then reused from the statement cache
+        cursor.parse(query)
+    else:
+        # Fetch in large batches to cut the number of round trips to the database
+        cursor.arraysize = arraysize
+        cursor.prefetchrows = prefetchrows if prefetchrows is not None else arraysize + 1
+        cursor.outputtypehandler = fetch_lobs_inline
+        cursor.execute(query, parameters)
+
+    columns = [desc[0] for desc in cursor.description]
+    header = ','.join(columns) + '\n' if not shard else ''
+
+    with open_export_file(save_path, compression, io_backend) as csv_file:
+        csv_file.write(header.encode('utf-8'))
+        if use_data_frames:
+            write_data_frames_arrow(cursor.connection, query, parameters, arraysize, csv_file)
+        elif csv_engine == 'arrow':
+            write_rows_arrow(cursor, columns, csv_file, row_count)
+        else:
+            write_rows_python(cursor, csv_file, row_count)
+
+    if count_hint and not use_data_frames:
+        # End the read-only transaction
+        cursor.connection.rollback()
 
 
+def export_shard(connect_args, table_name, save_path, shard, shard_count, export_args):
+    """Worker entry point: exports one ORA_HASH shard of a table over its own connection.
 
-        return f"Table {table_name} exported successfully to {save_path}"
+    Returns None on success or the error message, so nothing that fails to
+    pickle has to travel back to the parent process.
+    """
+    try:
+        connection = connect_to_database(**connect_args)
+        try:
+            cursor = connection.cursor()
+            try:
+                export_table(cursor, table_name, save_path, shard=shard, shard_count=shard_count, **export_args)
+            finally:
+                cursor.close()
+        finally:
+            connection.close()
     except Exception as e:
-        return f"Failed to export table {table_name}: {str(e)}"
-    
+        return str(e)
+    return None
+
+
+def shard_path(save_path, shard, compression='none'):
+    """Returns the file name for one shard, with the part index before the extensions.
+
+    /tmp/x.csv becomes /tmp/x.part0.csv and, when compressed, /tmp/x.csv.gz
+    becomes /tmp/x.part0.csv.gz.
+    """
+    root, codec_ext = os.path.splitext(save_path) if compression != 'none' else (save_path, '')
+    root, ext = os.path.splitext(root)
+    return f"{root}.part{shard}{ext}{codec_ext}"
+
+
+def export_table_in_parallel(connect_args, table_name, save_path, parallelism, export_args):
+    """Exports a table into parallelism shard files, one worker process and connection per shard.
+
+    Returns (failed, message); failed is True when any shard did not export.
+    """
+    paths = [shard_path(save_path, shard, export_args.get('compression', 'none')) for shard in range(parallelism)]
+
+    # Forking is only safe in Thin mode: run_module rejects parallelism with Thick mode, and the
+    # parent holds no connection while the workers start
+    mp_context = multiprocessing.get_context('fork')
+    with concurrent.futures.ProcessPoolExecutor(max_workers=parallelism, mp_context=mp_context) as executor:
+        futures = [
+            executor.submit(export_shard, connect_args, table_name, path, shard, parallelism, export_args)
+            for shard, path in enumerate(paths)
+        ]
+
+        errors = []
+        for shard, future in enumerate(futures):
+            try:
+                error = future.result()
+            except Exception as e:
+                error = str(e)
+            if error:
+                errors.append(f"shard {shard}: {error}")
+
+    if errors:
+        return True, f"Failed to export table {table_name}: " + "; ".join(errors)
+    return False, f"Table {table_name} exported successfully to " + ", ".join(paths)
+
+
 def validate_wallet(wallet_location):
     """Check if the wallet directory exists and contains any files."""
-    if not wallet_location or not os.path.isdir(wallet_location):
-        return False, f"Wallet location '{wallet_location}' does not exist or is not a directory."
+    not_a_directory_msg = f"Wallet location '{wallet_location}' does not exist or is not a directory."
+    if not wallet_location:
+        return False, not_a_directory_msg
 
-    # Ensure that at least one file exists in the wallet directory
-    wallet_files = os.listdir(wallet_location)
-    if not wallet_files:
-        return False, f"Wallet location '{wallet_location}' is empty. No wallet files found."
+    # Ensure that at least one file exists in the wallet directory; stop at the first entry
+    try:
+        with os.scandir(wallet_location) as wallet_files:
+            if next(wallet_files, None) is None:
+                return False, f"Wallet location '{wallet_location}' is empty. No wallet files found."
+    except (FileNotFoundError, NotADirectoryError):
+        return False, not_a_directory_msg
 
     return True, ""
 
+
+def init_thick_mode(client_lib_dir, config_dir=None):
+    """Switches python-oracledb to Thick mode, loading the Oracle Client libraries only once per process."""
+    global _THICK_INITIALIZED
+    if _THICK_INITIALIZED:
+        return
+
+    oracledb.init_oracle_client(lib_dir=client_lib_dir, config_dir=config_dir)
+    _THICK_INITIALIZED = True
+
+
+def connect_to_database(username, password, host, port, service_name, use_tcps, wallet_location="",
+                        wallet_password=None, sdu=2097152):
+    """Opens a connection to the database over TCP, or TCPS when use_tcps is set."""
+    protocol = 'tcps' if use_tcps else 'tcp'
+    connect_args = dict(
+        user=username,
+        password=password,
+        stmtcachesize=STATEMENT_CACHE_SIZE,
+    )
+    if CONNECT_SUPPORTS_SDU:
+        # Pass the address as components so the driver does not have to parse a DSN string
+        connect_args.update(host=host, port=port, service_name=service_name, protocol=protocol, sdu=sdu)
+    else:
+        # Older drivers take the SDU from a connect descriptor instead of a keyword
+        connect_args['dsn'] = (
+            f"(DESCRIPTION=(SDU={sdu})(ADDRESS=(PROTOCOL={protocol})(HOST={host})(PORT={port}))"
+            f"(CONNECT_DATA=(SERVICE_NAME={service_name})))"
+        )
+    if use_tcps:
+        connect_args.update(
+            config_dir=wallet_location,
+            wallet_location=wallet_location,
+            wallet_password=wallet_password,
+        )
+        # Thick mode keeps the server DN check from the client's sqlnet.ora, as before
+        if oracledb.is_thin_mode():
+            connect_args['ssl_server_dn_match'] = True
+
+    return oracledb.connect(**connect_args)
+
 def run_module():
     module_args = dict(
         username=dict(type='str', required=True),
@@ -152,10 +725,19 @@ def run_module():
         service_name=dict(type='str', required=True),
         use_tcps=dict(type='bool', required=False, default=False),
         wallet_location=dict(type='str', required=False, default=""),
+        wallet_password=dict(type='str', required=False, no_log=True),
         client_lib_dir=dict(type='str', required=False, default=""),
         db_action=dict(type='str', required=True, choices=['export']),
         table_name=dict(type='str', required=False),
         save_path=dict(type='str', required=False),
+        arraysize=dict(type='int', required=False, default=10000),
+        prefetchrows=dict(type='int', required=False, default=None),
+        csv_engine=dict(type='str', required=False, default='python', choices=['python', 'arrow']),
+        count_hint=dict(type='bool', required=False, default=False),
+        compression=dict(type='str', required=False, default='none', choices=['none', 'gzip', 'zstd']),
+        io_backend=dict(type='str', required=False, default='sync', choices=['sync', 'thread']),
+        sdu=dict(type='int', required=False, default=2097152),
+        parallelism=dict(type='int', required=False, default=1),
     )
 
     result = dict(
@@ -175,57 +757,94 @@ def run_module():
     service_name = module.params['service_name']
     use_tcps = module.params['use_tcps']
     wallet_location = module.params.get('wallet_location', "")
+    wallet_password = module.params.get('wallet_password')
     client_lib_dir = module.params.get('client_lib_dir', "")
     db_action = module.params['db_action']
     table_name = module.params.get('table_name')
     save_path = module.params.get('save_path')
+    arraysize = module.params['arraysize']
+    prefetchrows = module.params['prefetchrows']
+    csv_engine = module.params['csv_engine']
+    count_hint = module.params['count_hint']
+    compression = module.params['compression']
+    io_backend = module.params['io_backend']
+    sdu = module.params['sdu']
+    parallelism = module.params['parallelism']
 
     if not host:
         module.fail_json(msg="Missing required parameter: host")
 
+    if csv_engine == 'arrow' and not HAS_PYARROW:
+        module.fail_json(msg=missing_required_lib('pyarrow'), exception=PYARROW_IMPORT_ERROR)
+
+    if compression == 'zstd' and not HAS_ZSTANDARD:
+        module.fail_json(msg=missing_required_lib('zstandard'), exception=ZSTANDARD_IMPORT_ERROR)
+
+    if parallelism < 1:
+        module.fail_json(msg="Parameter 'parallelism' must be at least 1")
+
+    if parallelism > 1 and client_lib_dir:
+        module.fail_json(msg="Parameter 'parallelism' greater than 1 is not supported with 'client_lib_dir' "
+                             "(Thick mode)")
+
     if module.check_mode:
         module.exit_json(**result)
 
     try:
-        # Initialize Oracle Client if Thick mode is required
-        if client_lib_dir and os.path.isdir(client_lib_dir):
-            oracledb.init_oracle_client(lib_dir=client_lib_dir)
-            os.environ["LD_LIBRARY_PATH"] = client_lib_dir
-
         # Set up TCPS connection using Oracle Wallet
         if use_tcps:
             wallet_valid, wallet_msg = validate_wallet(wallet_location)
             if not wallet_valid:
                 module.fail_json(msg=wallet_msg)
 
-            os.environ["TNS_ADMIN"] = wallet_location
-            os.environ["WALLET_LOCATION"] = wallet_location
-            os.environ["SSL_CERT_DIR"] = wallet_location
-            os.environ["IGNORE_ANO_ENCRYPTION_FOR_TCPS"] = "TRUE"
-
-            # Construct DSN
-            dsn = f"(DESCRIPTION=(ADDRESS=(PROTOCOL=TCPS)(HOST={host})(PORT={port}))(CONNECT_DATA=(SERVICE_NAME={service_name})))"
-
-            connection = oracledb.connect(user=username, password=password, dsn=dsn)
-
-        else:
-            # Standard TCP connection
-            dsn = f"{host}:{port}/{service_name}"
-            connection = oracledb.connect(user=username, password=password, dsn=dsn)
-
-        cursor = connection.cursor()
+        # Initialize Oracle Client only if Thick mode is requested; Thin mode needs no client libraries
+        if client_lib_dir and os.path.isdir(client_lib_dir):
+            init_thick_mode(client_lib_dir, config_dir=wallet_location if use_tcps else None)
+
+        connect_args = dict(
+            username=username,
+            password=password,
+            host=host,
+            port=port,
+            service_name=service_name,
+            use_tcps=use_tcps,
+            wallet_location=wallet_location,
+            wallet_password=wallet_password,
+            sdu=sdu,
+        )
 
         if db_action == "export":
             if not table_name or not save_path:
                 module.fail_json(msg="Both 'table_name' and 'save_path' are required for export db_action")
 
-            message = export_table_to_csv(cursor, table_name, save_path)
+            if not TABLE_NAME_PATTERN.fullmatch(table_name):
+                module.fail_json(msg=f"Invalid table_name '{table_name}': expected TABLE or SCHEMA.TABLE")
+
+            export_args = dict(arraysize=arraysize, prefetchrows=prefetchrows, csv_engine=csv_engine,
+                               count_hint=count_hint, compression=compression, io_backend=io_backend)
+
+            if parallelism > 1:
+                failed, message = export_table_in_parallel(connect_args, table_name, save_path, parallelism,
+                                                           export_args)
+                if failed:
+                    module.fail_json(msg=message, **result)
+            else:
+                connection = connect_to_database(**connect_args)
+                try:
+                    cursor = connection.cursor()
+                    try:
+                        export_table(cursor, table_name, save_path, **export_args)
+                    except Exception as e:
+                        module.fail_json(msg=f"Failed to export table {table_name}: {str(e)}", **result)
+                    finally:
+                        cursor.close()
+                finally:
+                    connection.close()
+                message = f"Table {table_name} exported successfully to {save_path}"
+
             result['changed'] = True
             result['message'] = message
 
-        cursor.close()
-        connection.close()
-
     except oracledb.DatabaseError as e:
         error_msg = f"Database connection failed: {str(e)}"
         module.fail_json(msg=error_msg, **result)